@@ -0,0 +1,135 @@
+# backend/app/activity.py
+"""Per-board activity log with an asynchronous, batched writer.
+
+Mutations call ``activity_log.record(...)`` which only enqueues an event on a
+bounded in-process queue. A background thread drains the queue and writes the
+events to the ``activity`` table in batches (one executemany per batch),
+flushing whenever ``batch_size`` events are pending or ``flush_interval``
+seconds have passed since the first pending event. ``stop()`` drains and
+flushes whatever is left, and is called on application shutdown.
+
+Delivery policy (best effort): events are not guaranteed to be written.
+A batch that fails with a transient error (a locked database, a dropped
+connection) is retried up to ``max_attempts`` times, and a retry after a commit
+whose acknowledgement was lost can write the batch twice, so readers must
+tolerate the occasional duplicate row. Events are dropped, and logged, when:
+
+- the queue stays full for ``enqueue_timeout`` seconds (``record`` returns
+  False rather than blocking the request),
+- a batch fails with a non-transient error or exhausts ``max_attempts``, so one
+  bad batch cannot wedge the writer,
+- ``stop()`` cannot drain the queue within its ``timeout``,
+- the process is killed rather than shut down.
+"""
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError, OperationalError
+from app.database import engine
+from app.models import Activity
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ActivityLog:
+    def __init__(self, engine: Engine, max_queue_size: int = 10_000, batch_size: int = 500,
+                 flush_interval: float = 1.0, enqueue_timeout: float = 0.05, retry_delay: float = 0.5,
+                 max_attempts: int = 5):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: threading.Thread | None = None
+
+    def record(self, board_id: int, user_id: int, action: str, entity_type: str, entity_id: int) -> bool:
+        event = {
+            "board_id": board_id,
+            "user_id": user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "created_at": datetime.now(tz=timezone.utc),
+        }
+        try:
+            self._queue.put(event, timeout=self.enqueue_timeout)
+        except queue.Full:
+            logger.warning("Activity queue full, dropping %s %s %s", action, entity_type, entity_id)
+            return False
+        return True
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="activity-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self._thread is None:
+            return
+        thread, self._thread = self._thread, None
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Activity writer is not draining, abandoning %d queued events", self._queue.qsize())
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.error("Activity writer did not finish within %.1fs, queued events may be lost", timeout)
+
+    def _run(self) -> None:
+        batch: list[dict] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush(batch)
+                return
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if len(batch) >= self.batch_size or (deadline is not None and time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+                deadline = None
+
+    def _flush(self, batch: list[dict]) -> None:
+        if not batch:
+            return
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(insert(Activity), batch)
+                return
+            except Exception as e:
+                if not _is_transient(e) or attempt == self.max_attempts:
+                    logger.exception("Dropping %d activity events after %d attempt(s)", len(batch), attempt)
+                    return
+                logger.warning("Failed to write %d activity events (attempt %d), retrying", len(batch), attempt)
+                time.sleep(self.retry_delay)
+
+
+def _is_transient(error: Exception) -> bool:
+    # Lock timeouts and dropped connections can succeed on retry; constraint
+    # violations, bad values and the like never will.
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(error, OperationalError)
+
+
+activity_log = ActivityLog(engine)
@@ -1,7 +1,28 @@
 import bcrypt
-from app.models import User, Board, List, Card
+from collections import defaultdict
+from datetime import datetime, timezone
+from app.models import User, Board, List, Card, CardArchive, Activity
+from app.schemas import BoardRead, ListRead, CardRead
+from sqlalchemy import Boolean, String, and_, delete, func, insert, literal, select, union_all, update
 from sqlalchemy.orm import Session
 
+# Response schema field -> column for the Core read paths. Boards and lists
+# store their title in ``name``, and boards have no description column.
+READ_COLUMNS = {
+    BoardRead: {
+        "title": Board.name,
+        "description": literal(None, String),
+        "id": Board.id,
+        "owner_id": Board.owner_id,
+    },
+    ListRead: {
+        "title": List.name,
+        "board_id": List.board_id,
+        "id": List.id,
+    },
+    CardRead: {name: getattr(Card, name) for name in CardRead.model_fields},
+}
+
 #----- User CRUD operations -----#
 
 def get_user_by_username(db: Session, username: str):
@@ -58,36 +79,63 @@ def get_board_by_id(db: Session, board_id: int):
     return db.query(Board).filter(Board.id == board_id).first()
 
 
-def get_boards_by_owner_id(db: Session, owner_id: int):
-    return db.query(Board).filter(Board.owner_id == owner_id).all()
-
-
-def update_board(db: Session, board_id: int, title: str | None = None, description: str | None = None):
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if board:
-        if title:
-            board.title = title
-        if description:
-            board.description = description
-        db.commit()
-        db.refresh(board)
+def get_boards_by_owner_id(db: Session, owner_id: int, fields: list[str] | None = None):
+    return _select_rows(db, BoardRead, fields, Board.owner_id == owner_id)
+
+
+def get_board_summaries_by_owner_id(db: Session, owner_id: int):
+    # List and card counts come from the denormalized counters; only the
+    # overdue count depends on "now" and is aggregated here in the same query.
+    now = datetime.now(tz=timezone.utc)
+    stmt = (
+        select(
+            Board.id,
+            Board.owner_id,
+            Board.name.label("title"),
+            Board.list_count,
+            Board.card_count,
+            func.count(Card.id).label("overdue_count"),
+        )
+        .outerjoin(List, List.board_id == Board.id)
+        .outerjoin(Card, and_(Card.list_id == List.id, Card.due_date < now))
+        .where(Board.owner_id == owner_id)
+        .group_by(Board.id)
+    )
+    return db.execute(stmt).all()
+
+
+def update_board(db: Session, board_id: int, owner_id: int, title: str | None = None):
+    # Boards store their title in ``name`` and have no description column.
+    values = _changed_values(name=title)
+    criteria = (Board.id == board_id, Board.owner_id == owner_id)
+    columns = _read_columns(BoardRead)
+    if values:
+        stmt = update(Board).where(*criteria).values(**values).returning(*columns)
     else:
-        raise ValueError("Board not found")
+        stmt = select(*columns).where(*criteria)
+    board = _write_one(db, stmt, "Board not found")
+    db.commit()
     return board
 
 
-def delete_board(db: Session, board_id: int):
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if board:
-        db.delete(board)
-        db.commit()
-    else:
-        raise ValueError("Board not found")
+def delete_board(db: Session, board_id: int, owner_id: int):
+    board = _write_one(
+        db,
+        delete(Board).where(Board.id == board_id, Board.owner_id == owner_id).returning(*Board.__table__.c),
+        "Board not found",
+    )
+    # Core deletes bypass the ORM cascade, so remove the children explicitly.
+    list_ids = select(List.id).where(List.board_id == board_id)
+    _execute(db, delete(Card).where(Card.list_id.in_(list_ids)))
+    _execute(db, delete(CardArchive).where(CardArchive.list_id.in_(list_ids)))
+    _execute(db, delete(List).where(List.board_id == board_id))
+    db.commit()
     return board
 
 
-def create_board(db: Session, title: str, description: str | None, owner_id: int):
-    db_board = Board(title=title, description=description, owner_id=owner_id)
+def create_board(db: Session, title: str, owner_id: int):
+    # Boards store their title in ``name`` and have no description column.
+    db_board = Board(name=title, owner_id=owner_id)
     db.add(db_board)
     db.commit()
     db.refresh(db_board)
@@ -100,35 +148,47 @@ def get_list_by_id(db: Session, list_id: int):
     return db.query(List).filter(List.id == list_id).first()
 
 
-def get_lists_by_board_id(db: Session, board_id: int):
-    return db.query(List).filter(List.board_id == board_id).all()
+def get_lists_by_board_id(db: Session, board_id: int, fields: list[str] | None = None):
+    return _select_rows(db, ListRead, fields, List.board_id == board_id)
 
 
-def update_list(db: Session, list_id: int, title: str | None = None):
-    lst = db.query(List).filter(List.id == list_id).first()
-    if lst:
-        if title:
-            lst.title = title
-        db.commit()
-        db.refresh(lst)
+def update_list(db: Session, list_id: int, owner_id: int, title: str | None = None):
+    values = _changed_values(name=title)
+    criteria = (List.id == list_id, List.board_id.in_(_owned_board_ids(owner_id)))
+    columns = _read_columns(ListRead)
+    if values:
+        stmt = update(List).where(*criteria).values(**values).returning(*columns)
     else:
-        raise ValueError("List not found")
+        stmt = select(*columns).where(*criteria)
+    lst = _write_one(db, stmt, "List not found")
+    db.commit()
     return lst
 
 
-def delete_list(db: Session, list_id: int):
-    lst = db.query(List).filter(List.id == list_id).first()
-    if lst:
-        db.delete(lst)
-        db.commit()
-    else:
-        raise ValueError("List not found")
+def delete_list(db: Session, list_id: int, owner_id: int):
+    lst = _write_one(
+        db,
+        delete(List)
+        .where(List.id == list_id, List.board_id.in_(_owned_board_ids(owner_id)))
+        .returning(*List.__table__.c),
+        "List not found",
+    )
+    _execute(db, delete(Card).where(Card.list_id == list_id))
+    _execute(db, delete(CardArchive).where(CardArchive.list_id == list_id))
+    _execute(
+        db,
+        update(Board)
+        .where(Board.id == lst.board_id)
+        .values(list_count=Board.list_count - 1, card_count=Board.card_count - lst.card_count)
+    )
+    db.commit()
     return lst
 
 
 def create_list(db: Session, title: str, board_id: int):
-    db_list = List(title=title, board_id=board_id)
+    db_list = List(name=title, board_id=board_id)
     db.add(db_list)
+    db.execute(update(Board).where(Board.id == board_id).values(list_count=Board.list_count + 1))
     db.commit()
     db.refresh(db_list)
     return db_list
@@ -140,38 +200,208 @@ def get_card_by_id(db: Session, card_id: int):
     return db.query(Card).filter(Card.id == card_id).first()
 
 
-def get_cards_by_list_id(db: Session, list_id: int):
-    return db.query(Card).filter(Card.list_id == list_id).all()
+def get_cards_by_list_id(db: Session, list_id: int, fields: list[str] | None = None, include_archived: bool = False):
+    if not include_archived:
+        return _select_rows(db, CardRead, fields, Card.list_id == list_id)
+    fields = fields or list(READ_COLUMNS[CardRead])
+    hot = select(*_read_columns(CardRead, fields), literal(False, Boolean).label("archived"))
+    cold = select(*[getattr(CardArchive, name) for name in fields], literal(True, Boolean).label("archived"))
+    stmt = union_all(hot.where(Card.list_id == list_id), cold.where(CardArchive.list_id == list_id))
+    return db.execute(stmt).all()
 
 
-def update_card(db: Session, card_id: int, title: str | None = None, description: str | None = None):
-    card = db.query(Card).filter(Card.id == card_id).first()
-    if card:
-        if title:
-            card.title = title
-        if description:
-            card.description = description
-        db.commit()
-        db.refresh(card)
+def update_card(db: Session, card_id: int, owner_id: int, title: str | None = None, description: str | None = None):
+    values = _changed_values(title=title, description=description)
+    criteria = (Card.id == card_id, Card.list_id.in_(_owned_list_ids(owner_id)))
+    # board_id rides along in the RETURNING clause for the activity log
+    columns = (*Card.__table__.c, _card_board_id())
+    if values:
+        stmt = update(Card).where(*criteria).values(**values).returning(*columns)
     else:
-        raise ValueError("Card not found")
+        stmt = select(*columns).where(*criteria)
+    card = _write_one(db, stmt, "Card not found")
+    db.commit()
     return card
 
 
-def delete_card(db: Session, card_id: int):
-    card = db.query(Card).filter(Card.id == card_id).first()
-    if card:
-        db.delete(card)
-        db.commit()
-    else:
-        raise ValueError("Card not found")
+def delete_card(db: Session, card_id: int, owner_id: int):
+    card = _write_one(
+        db,
+        delete(Card)
+        .where(Card.id == card_id, Card.list_id.in_(_owned_list_ids(owner_id)))
+        .returning(*Card.__table__.c, _card_board_id()),
+        "Card not found",
+    )
+    _adjust_card_counters(db, card.list_id, -1)
+    db.commit()
     return card
 
 
-def create_card(db: Session, title: str, description: str | None, list_id: int):
-    db_card = Card(title=title, description=description, list_id=list_id)
+def create_card(db: Session, title: str, description: str | None, list_id: int, position: int, due_date: datetime | None = None):
+    db_card = Card(title=title, description=description, list_id=list_id, position=position, due_date=due_date)
     db.add(db_card)
+    _adjust_card_counters(db, list_id, 1)
     db.commit()
     db.refresh(db_card)
     return db_card
 
+
+#----- Card archiving -----#
+
+def archive_card(db: Session, card_id: int, owner_id: int):
+    criteria = (Card.id == card_id, Card.list_id.in_(_owned_list_ids(owner_id)))
+    _copy_cards(db, Card, CardArchive, *criteria)
+    card = _write_one(
+        db,
+        delete(Card).where(*criteria).returning(*Card.__table__.c, _card_board_id()),
+        "Card not found",
+    )
+    _adjust_card_counters(db, card.list_id, -1)
+    db.commit()
+    return card
+
+
+def archive_cards_in_list(db: Session, list_id: int, older_than: datetime, chunk_size: int = 500):
+    # Move cards untouched since older_than in chunks, committing after each
+    # one so a large list never holds the write lock for long.
+    if older_than.tzinfo is not None:
+        # Timestamps are stored as naive UTC and SQLite drops tzinfo on bind.
+        older_than = older_than.astimezone(timezone.utc).replace(tzinfo=None)
+    archived = 0
+    while True:
+        card_ids = db.scalars(
+            select(Card.id)
+            .where(Card.list_id == list_id, Card.updated_at < older_than)
+            .order_by(Card.id)
+            .limit(chunk_size)
+        ).all()
+        if not card_ids:
+            return archived
+        _copy_cards(db, Card, CardArchive, Card.id.in_(card_ids))
+        _execute(db, delete(Card).where(Card.id.in_(card_ids)))
+        _adjust_card_counters(db, list_id, -len(card_ids))
+        db.commit()
+        archived += len(card_ids)
+
+
+def restore_card(db: Session, card_id: int, owner_id: int):
+    criteria = (CardArchive.id == card_id, CardArchive.list_id.in_(_owned_list_ids(owner_id)))
+    _copy_cards(db, CardArchive, Card, *criteria)
+    board_id = select(List.board_id).where(List.id == CardArchive.list_id).scalar_subquery().label("board_id")
+    card = _write_one(
+        db,
+        delete(CardArchive)
+        .where(*criteria)
+        .returning(*[CardArchive.__table__.c[name] for name in Card.__table__.c.keys()], board_id),
+        "Archived card not found",
+    )
+    _adjust_card_counters(db, card.list_id, 1)
+    db.commit()
+    return card
+
+
+def _copy_cards(db: Session, source, target, *criteria):
+    # Set-based INSERT ... SELECT between the hot and archive tables.
+    now = datetime.now(tz=timezone.utc)
+    names = list(Card.__table__.c.keys())
+    columns = [source.__table__.c[name] for name in names]
+    if target is CardArchive:
+        names.append("archived_at")
+        columns.append(literal(now, CardArchive.archived_at.type))
+    else:
+        # A restore counts as a touch, so the card is not re-archived by the
+        # next sweep with the same cutoff.
+        columns[names.index("updated_at")] = literal(now, Card.updated_at.type)
+    _execute(db, insert(target).from_select(names, select(*columns).where(*criteria)))
+
+
+def _adjust_card_counters(db: Session, list_id: int, delta: int):
+    # Runs in the caller's transaction so the counters commit with the card.
+    db.execute(update(List).where(List.id == list_id).values(card_count=List.card_count + delta))
+    board_id = select(List.board_id).where(List.id == list_id).scalar_subquery()
+    db.execute(update(Board).where(Board.id == board_id).values(card_count=Board.card_count + delta))
+
+
+#----- Single-statement write helpers -----#
+
+def _owned_board_ids(owner_id: int):
+    return select(Board.id).where(Board.owner_id == owner_id)
+
+
+def _owned_list_ids(owner_id: int):
+    return select(List.id).join(Board, List.board_id == Board.id).where(Board.owner_id == owner_id)
+
+
+def _card_board_id():
+    return select(List.board_id).where(List.id == Card.list_id).scalar_subquery().label("board_id")
+
+
+def _changed_values(**values):
+    # Mirrors the old "only overwrite truthy fields" update semantics.
+    return {key: value for key, value in values.items() if value}
+
+
+def _execute(db: Session, stmt):
+    # The WHERE clause already scopes these statements, so skip the ORM's
+    # identity-map synchronisation and the extra SELECT it may issue.
+    return db.execute(stmt, execution_options={"synchronize_session": False})
+
+
+def _write_one(db: Session, stmt, not_found: str):
+    # Ownership is part of the WHERE clause, so "not found" also covers rows
+    # that belong to someone else.
+    row = _execute(db, stmt).one_or_none()
+    if row is None:
+        db.rollback()
+        raise ValueError(not_found)
+    return row
+
+
+#----- Activity log -----#
+
+def get_activity_by_board_id(db: Session, board_id: int, before_id: int | None = None, limit: int = 50):
+    # Keyset pagination, newest first, served by the (board_id, id) index.
+    stmt = select(Activity).where(Activity.board_id == board_id)
+    if before_id is not None:
+        stmt = stmt.where(Activity.id < before_id)
+    stmt = stmt.order_by(Activity.id.desc()).limit(limit)
+    return db.scalars(stmt).all()
+
+
+#----- Read-only row queries -----#
+
+def _select_rows(db: Session, schema, fields: list[str] | None, *criteria):
+    # Collection reads bypass the ORM: a Core SELECT over exactly the
+    # requested columns returns lightweight Row tuples, with no identity map
+    # entries or instance state, that go straight to serialization.
+    return db.execute(select(*_read_columns(schema, fields)).where(*criteria)).all()
+
+
+def _read_columns(schema, fields: list[str] | None = None):
+    fields = fields or list(READ_COLUMNS[schema])
+    return [READ_COLUMNS[schema][name].label(name) for name in fields]
+
+
+#----- Counter maintenance -----#
+
+def recompute_counters(db: Session):
+    """Rebuild the denormalized list/card counters from a single GROUP BY."""
+    rows = db.execute(
+        select(List.id, List.board_id, func.count(Card.id))
+        .outerjoin(Card, Card.list_id == List.id)
+        .group_by(List.id)
+    ).all()
+
+    board_counts = defaultdict(lambda: {"list_count": 0, "card_count": 0})
+    for list_id, board_id, card_count in rows:
+        board_counts[board_id]["list_count"] += 1
+        board_counts[board_id]["card_count"] += card_count
+
+    # Boards without lists never show up in the GROUP BY, so reset first.
+    db.execute(update(Board).values(list_count=0, card_count=0))
+    if rows:
+        db.execute(update(List), [{"id": list_id, "card_count": card_count} for list_id, _, card_count in rows])
+    if board_counts:
+        db.execute(update(Board), [{"id": board_id, **counts} for board_id, counts in board_counts.items()])
+    db.commit()
+    return len(rows), len(board_counts)
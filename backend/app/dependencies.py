@@ -2,11 +2,12 @@ import jwt
 import os
 from dotenv import load_dotenv
 from fastapi.security import OAuth2PasswordBearer
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import User
-from app.crud import get_user_by_email
+from app.crud import get_user_by_email, READ_COLUMNS
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -26,4 +27,25 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
     
-    return user
\ No newline at end of file
+    return user
+
+
+def sparse_fields(model: type[BaseModel]):
+    """Build a dependency parsing ``?fields=a,b,c`` against ``model``'s fields.
+
+    Names are checked against the same field -> column map the crud reads
+    select from. Returns ``None`` when no fieldset was requested. ``id`` is
+    always included.
+    """
+    allowed = set(READ_COLUMNS[model])
+
+    def parse_fields(fields: str | None = Query(None, description="Comma separated list of fields to return")) -> list[str] | None:
+        if not fields:
+            return None
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in allowed]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        return list(dict.fromkeys(["id", *requested]))
+
+    return parse_fields
@@ -1,9 +1,39 @@
 # backend/app/main.py
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routers import boards, lists, cards, users
+from app.activity import activity_log
+from app.database import engine
+from app.profiling import ProfilingMiddleware
 
+# Responses smaller than this (in bytes) are not worth compressing
+GZIP_MINIMUM_SIZE = int(os.getenv('GZIP_MINIMUM_SIZE', '1000'))
 
-app = FastAPI()
+# Opt-in request profiling, see app/profiling.py
+PROFILE_ENABLED = os.getenv('PROFILE_ENABLED', '0') == '1'
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    activity_log.start()
+    yield
+    # Flush any queued activity events before the process exits
+    activity_log.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=6)
+if PROFILE_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        engine=engine,
+        profile_dir=os.getenv('PROFILE_DIR', 'profiles'),
+        sample_rate=float(os.getenv('PROFILE_SAMPLE_RATE', '0')),
+        secret=os.getenv('PROFILE_SECRET'),
+        max_files=int(os.getenv('PROFILE_MAX_FILES', '200')),
+    )
 app.include_router(boards.router)
 app.include_router(lists.router)
 app.include_router(cards.router)
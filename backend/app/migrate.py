@@ -0,0 +1,85 @@
+# backend/app/migrate.py
+# One-off upgrade of an existing SQLite database to the current models.
+# create_all (run when app.database is imported) only creates missing tables;
+# this adds the board/list counter columns, rebuilds cards with timestamps and
+# AUTOINCREMENT, creates missing indexes and then recomputes the counters.
+# Run with: python -m app.migrate
+from datetime import datetime, timezone
+from sqlalchemy import inspect, text
+from app.crud import recompute_counters
+from app.database import SessionLocal, engine
+from app.models import Base, Card
+
+COUNTER_COLUMNS = {
+    "boards": ["list_count", "card_count"],
+    "lists": ["card_count"],
+}
+
+
+def add_counter_columns(conn) -> list[str]:
+    added = []
+    inspector = inspect(conn)
+    for table, columns in COUNTER_COLUMNS.items():
+        existing = {column["name"] for column in inspector.get_columns(table)}
+        for column in columns:
+            if column not in existing:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"))
+                added.append(f"{table}.{column}")
+    return added
+
+
+def rebuild_cards(conn) -> bool:
+    table_sql = conn.execute(text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'cards'")).scalar()
+    existing = {column["name"] for column in inspect(conn).get_columns("cards")}
+    if "AUTOINCREMENT" in table_sql.upper() and {"created_at", "updated_at"} <= existing:
+        return False
+
+    # SQLite can't add AUTOINCREMENT in place: copy into a freshly created table.
+    conn.execute(text("ALTER TABLE cards RENAME TO cards_old"))
+    old_indexes = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'cards_old' AND sql IS NOT NULL")
+    ).scalars().all()
+    for name in old_indexes:
+        conn.execute(text(f'DROP INDEX "{name}"'))
+    Card.__table__.create(conn)
+
+    copied = ["id", "title", "description", "list_id", "position", "due_date"]
+    created_at = "created_at" if "created_at" in existing else ":now"
+    updated_at = "updated_at" if "updated_at" in existing else ":now"
+    conn.execute(
+        text(
+            f"INSERT INTO cards ({', '.join(copied)}, created_at, updated_at) "
+            f"SELECT {', '.join(copied)}, {created_at}, {updated_at} FROM cards_old"
+        ),
+        {"now": datetime.now(tz=timezone.utc).replace(tzinfo=None)},
+    )
+    conn.execute(text("DROP TABLE cards_old"))
+    return True
+
+
+def create_missing_indexes(conn) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def main():
+    if engine.dialect.name != "sqlite":
+        raise SystemExit("app.migrate only supports SQLite databases")
+    with engine.begin() as conn:
+        added = add_counter_columns(conn)
+        rebuilt = rebuild_cards(conn)
+        create_missing_indexes(conn)
+    print(f"Added columns: {', '.join(added) or 'none'}")
+    print(f"Rebuilt cards table: {'yes' if rebuilt else 'no'}")
+
+    db = SessionLocal()
+    try:
+        lists, boards = recompute_counters(db)
+    finally:
+        db.close()
+    print(f"Recomputed counters for {lists} lists across {boards} boards")
+
+
+if __name__ == "__main__":
+    main()
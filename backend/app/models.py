@@ -1,5 +1,5 @@
-from sqlalchemy import Integer, String, ForeignKey, DateTime
-from sqlalchemy.orm import relationship, declarative_base, Mapped, mapped_column
+from sqlalchemy import Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship, declarative_base, synonym, Mapped, mapped_column
 from datetime import datetime, timezone
 
 Base = declarative_base()
@@ -32,7 +32,9 @@ class Board(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(index=True)
-    owner_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    owner_id: Mapped[int] = mapped_column(ForeignKey('users.id'), index=True)
+    list_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    card_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(tz=timezone.utc),
         nullable=False
@@ -43,6 +45,9 @@ class Board(Base):
         nullable=False
     )
     
+    # The API calls it a title; read-only alias so schemas validate from the row
+    title = synonym("name")
+
     owner = relationship("User", back_populates="boards")
     lists = relationship("List", back_populates="board", cascade="all, delete-orphan")
 
@@ -55,10 +60,14 @@ class List(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(index=True)
-    board_id: Mapped[int] = mapped_column(ForeignKey('boards.id'))
+    board_id: Mapped[int] = mapped_column(ForeignKey('boards.id'), index=True)
+    card_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+
+    title = synonym("name")
 
     board = relationship("Board", back_populates="lists")
     cards = relationship("Card", back_populates="list", cascade="all, delete-orphan")
+    archived_cards = relationship("CardArchive", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<List(name={self.name}, board_id={self.board_id})>"
@@ -66,15 +75,69 @@ class List(Base):
 
 class Card(Base):
     __tablename__ = 'cards'
+    # Never reuse ids: archived cards keep theirs and may be restored later.
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(index=True)
     description: Mapped[str] = mapped_column(index=True)
-    list_id: Mapped[int] = mapped_column(ForeignKey('lists.id'))
+    list_id: Mapped[int] = mapped_column(ForeignKey('lists.id'), index=True)
     position: Mapped[int] = mapped_column(index=True)
     due_date: Mapped[datetime] = mapped_column(index=True, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(tz=timezone.utc),
+        nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(tz=timezone.utc),
+        onupdate=lambda: datetime.now(tz=timezone.utc),
+        nullable=False
+    )
 
     list = relationship("List", back_populates="cards")
 
     def __repr__(self):
         return f"<Card(title={self.title}, list_id={self.list_id}, position={self.position})>"
+
+
+class CardArchive(Base):
+    __tablename__ = 'cards_archive'
+
+    # Cold copy of Card: same columns, but only list_id is indexed since
+    # archived cards are read per list and restored by id.
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column()
+    description: Mapped[str] = mapped_column()
+    list_id: Mapped[int] = mapped_column(ForeignKey('lists.id'), index=True)
+    position: Mapped[int] = mapped_column()
+    due_date: Mapped[datetime] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(tz=timezone.utc),
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"<CardArchive(title={self.title}, list_id={self.list_id}, archived_at={self.archived_at})>"
+
+
+class Activity(Base):
+    __tablename__ = 'activity'
+    __table_args__ = (Index('ix_activity_board_id_id', 'board_id', 'id'),)
+
+    # board_id/user_id are plain integers rather than foreign keys so the
+    # history outlives deleted boards and users.
+    id: Mapped[int] = mapped_column(primary_key=True)
+    board_id: Mapped[int] = mapped_column(Integer)
+    user_id: Mapped[int] = mapped_column(Integer)
+    action: Mapped[str] = mapped_column(String)
+    entity_type: Mapped[str] = mapped_column(String)
+    entity_id: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(tz=timezone.utc),
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"<Activity(board_id={self.board_id}, action={self.action}, entity_type={self.entity_type}, entity_id={self.entity_id})>"
@@ -0,0 +1,203 @@
+# backend/app/profiling.py
+"""Opt-in per-request sampling profiler.
+
+Enabled with ``PROFILE_ENABLED=1``. A request is profiled when it carries a
+valid ``X-Debug-Profile`` header (see ``sign_token``) or when it is picked by
+``PROFILE_SAMPLE_RATE``. Sync routes run in a worker thread, out of reach of a
+cProfile started in the middleware, so a background thread samples every
+busy thread's stack instead; concurrent requests can leak samples into each
+other's profiles. Each profile is written as JSON to ``PROFILE_DIR`` together
+with the route, wall time and SQL statement count, and only the newest
+``PROFILE_MAX_FILES`` files are kept.
+
+Report: python -m app.profiling report [--dir DIR] [--top N]
+Token:  python -m app.profiling sign [--ttl SECONDS]
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from pathlib import Path
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+PROFILE_HEADER = "X-Debug-Profile"
+
+# Stacks whose innermost frame is in one of these files are idle threads
+# (threadpool workers waiting for work, the event loop waiting on sockets).
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py")
+
+_sql_counter: ContextVar[list[int] | None] = ContextVar("profile_sql_counter", default=None)
+
+
+def sign_token(secret: str, ttl: int = 300) -> str:
+    expires = int(time.time()) + ttl
+    signature = hmac.new(secret.encode(), str(expires).encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{signature}"
+
+
+def verify_token(secret: str, token: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+class StackSampler:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or os.path.basename(frame.f_code.co_filename) in _IDLE_FILES:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, engine: Engine, profile_dir: str, sample_rate: float = 0.0,
+                 secret: str | None = None, max_files: int = 200, interval: float = 0.005):
+        super().__init__(app)
+        self.profile_dir = Path(profile_dir)
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.max_files = max_files
+        self.interval = interval
+        event.listen(engine, "before_cursor_execute", _count_statement)
+
+    def should_profile(self, request: Request) -> bool:
+        token = request.headers.get(PROFILE_HEADER)
+        if token and self.secret and verify_token(self.secret, token):
+            return True
+        return random.random() < self.sample_rate
+
+    async def dispatch(self, request: Request, call_next):
+        if not self.should_profile(request):
+            return await call_next(request)
+
+        sql_count = [0]
+        reset = _sql_counter.set(sql_count)
+        start = time.perf_counter()
+        try:
+            with StackSampler(self.interval) as sampler:
+                response = await call_next(request)
+        finally:
+            _sql_counter.reset(reset)
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        route = request.scope.get("route")
+        self.write_profile({
+            "route": getattr(route, "path", request.url.path),
+            "method": request.method,
+            "path": request.url.path,
+            "status_code": response.status_code,
+            "wall_ms": round(wall_ms, 3),
+            "sql_count": sql_count[0],
+            "interval": self.interval,
+            "samples": sampler.samples,
+            "stacks": dict(sampler.stacks),
+        })
+        return response
+
+    def write_profile(self, profile: dict) -> None:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns()}-{profile['method']}.json"
+        (self.profile_dir / name).write_text(json.dumps(profile))
+        files = sorted(self.profile_dir.glob("*.json"))
+        for old in files[:-self.max_files]:
+            old.unlink(missing_ok=True)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    # The context variable is copied into the threadpool that runs sync
+    # routes, so statements count toward the request that issued them.
+    counter = _sql_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+#----- Report CLI -----#
+
+def build_report(profile_dir: Path, top: int) -> str:
+    routes: dict[str, dict] = defaultdict(lambda: {
+        "requests": 0, "wall_ms": 0.0, "sql_count": 0, "samples": 0, "self": Counter(), "total": Counter()
+    })
+    for path in sorted(profile_dir.glob("*.json")):
+        profile = json.loads(path.read_text())
+        stats = routes[f"{profile['method']} {profile['route']}"]
+        stats["requests"] += 1
+        stats["wall_ms"] += profile["wall_ms"]
+        stats["sql_count"] += profile["sql_count"]
+        for stack, count in profile["stacks"].items():
+            frames = stack.split(";")
+            stats["samples"] += count
+            stats["self"][frames[-1]] += count
+            for frame in set(frames):
+                stats["total"][frame] += count
+
+    lines = []
+    for route, stats in sorted(routes.items(), key=lambda item: -item[1]["wall_ms"]):
+        requests = stats["requests"]
+        lines.append(
+            f"{route}: {requests} requests, avg {stats['wall_ms'] / requests:.1f} ms, "
+            f"avg {stats['sql_count'] / requests:.1f} SQL statements, {stats['samples']} samples"
+        )
+        samples = stats["samples"] or 1
+        lines.append("  self%   total%  function")
+        for frame, count in stats["self"].most_common(top):
+            lines.append(f"  {100 * count / samples:5.1f}  {100 * stats['total'][frame] / samples:6.1f}  {frame}")
+        lines.append("")
+    return "\n".join(lines) if lines else f"No profiles found in {profile_dir}"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.profiling")
+    commands = parser.add_subparsers(dest="command", required=True)
+    report = commands.add_parser("report", help="aggregate captured profiles by route")
+    report.add_argument("--dir", default=os.getenv("PROFILE_DIR", "profiles"))
+    report.add_argument("--top", type=int, default=15)
+    sign = commands.add_parser("sign", help=f"print a value for the {PROFILE_HEADER} header")
+    sign.add_argument("--ttl", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    if args.command == "report":
+        print(build_report(Path(args.dir), args.top))
+    else:
+        secret = os.getenv("PROFILE_SECRET")
+        if not secret:
+            parser.error("PROFILE_SECRET environment variable is not set")
+        print(sign_token(secret, args.ttl))
+
+
+if __name__ == "__main__":
+    main()
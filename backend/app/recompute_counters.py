@@ -0,0 +1,18 @@
+# backend/app/recompute_counters.py
+# Repair job for the denormalized board/list counters.
+# Run with: python -m app.recompute_counters
+from app.crud import recompute_counters
+from app.database import SessionLocal
+
+
+def main():
+    db = SessionLocal()
+    try:
+        lists, boards = recompute_counters(db)
+    finally:
+        db.close()
+    print(f"Recomputed counters for {lists} lists across {boards} boards")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
-from app.schemas import BoardCreate, BoardUpdate, BoardRead
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from app.crud import get_board_by_id, get_boards_by_owner_id, create_board, update_board, delete_board
+from app.schemas import BoardCreate, BoardUpdate, BoardRead, BoardItem, BoardSummary, ActivityRead, ActivityPage
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from app.crud import get_board_by_id, get_boards_by_owner_id, get_board_summaries_by_owner_id, get_activity_by_board_id, create_board, update_board, delete_board
+from app.activity import activity_log
+from app.serialization import rows_response
 from app.database import get_db
 from app.models import User
 from sqlalchemy.orm import Session
 from collections.abc import Sequence
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, sparse_fields
 
 
 router = APIRouter(
@@ -28,14 +30,38 @@ def get_board_by_id_endpoint(board_id: int, db: Session = Depends(get_db), curen
     return BoardRead.model_validate(board)
 
 
+@router.get(
+    "/{board_id}/activity",
+    response_model=ActivityPage)
+def get_board_activity_endpoint(board_id: int, before_id: int | None = None, limit: int = Query(50, ge=1, le=200), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> ActivityPage:
+    board = get_board_by_id(db, board_id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if board.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this board")
+    events = get_activity_by_board_id(db, board_id, before_id=before_id, limit=limit)
+    next_before_id = events[-1].id if len(events) == limit else None
+    return ActivityPage(items=[ActivityRead.model_validate(event) for event in events], next_before_id=next_before_id)
+
+
 @router.get(
     "/owner/{owner_id}",
-    response_model=Sequence[BoardRead])
-def get_boards_by_owner_id_endpoint(owner_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Sequence[BoardRead]:
-    boards = get_boards_by_owner_id(db, owner_id)
+    response_model=Sequence[BoardItem])
+def get_boards_by_owner_id_endpoint(owner_id: int, fields: list[str] | None = Depends(sparse_fields(BoardRead)), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Response:
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to access these boards")
+    boards = get_boards_by_owner_id(db, owner_id, fields)
+    return rows_response(boards)
+
+
+@router.get(
+    "/owner/{owner_id}/summary",
+    response_model=Sequence[BoardSummary])
+def get_board_summaries_by_owner_id_endpoint(owner_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Sequence[BoardSummary]:
     if owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to access these boards")
-    return [BoardRead.model_validate(board) for board in boards]
+    rows = get_board_summaries_by_owner_id(db, owner_id)
+    return [BoardSummary.model_validate(row) for row in rows]
 
 
 @router.post(
@@ -46,10 +72,10 @@ def create_board_endpoint(board: BoardCreate, db: Session = Depends(get_db), cur
     try:
         db_board = create_board(db, 
                                 title=board.title, 
-                                description=board.description, 
                                 owner_id=current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    activity_log.record(db_board.id, current_user.id, "created", "board", db_board.id)
     return BoardRead.model_validate(db_board)
 
 
@@ -58,15 +84,11 @@ def create_board_endpoint(board: BoardCreate, db: Session = Depends(get_db), cur
     response_model=BoardRead
     )
 def update_board_endpoint(board_id: int, board: BoardUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> BoardRead:
-    db_board = get_board_by_id(db, board_id)
-    if not db_board:
-        raise HTTPException(status_code=404, detail="Board not found")
-    if db_board.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to update this board")
     try:
-        updated_board = update_board(db, board_id, title=board.title, description=board.description)
+        updated_board = update_board(db, board_id, current_user.id, title=board.title)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(board_id, current_user.id, "updated", "board", board_id)
     return BoardRead.model_validate(updated_board)
 
 
@@ -76,13 +98,9 @@ def update_board_endpoint(board_id: int, board: BoardUpdate, db: Session = Depen
     response_model=None
     )
 def delete_board_endpoint(board_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Response:
-    db_board = get_board_by_id(db, board_id)
-    if not db_board:
-        raise HTTPException(status_code=404, detail="Board not found")
-    if db_board.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to delete this board")
     try:
-        delete_board(db, board_id)
+        delete_board(db, board_id, current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(board_id, current_user.id, "deleted", "board", board_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from collections.abc import Sequence
-from app.schemas import CardCreate, CardRead, CardUpdate
+from datetime import datetime
+from app.schemas import CardCreate, CardRead, CardListItem, CardUpdate, ArchiveResult
 from app.models import User, Card
-from app.crud import get_card_by_id, get_cards_by_list_id, create_card, update_card, delete_card, get_list_by_id
+from app.crud import get_card_by_id, get_cards_by_list_id, create_card, update_card, delete_card, get_list_by_id, archive_card, archive_cards_in_list, restore_card
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, sparse_fields
+from app.activity import activity_log
+from app.serialization import rows_response
 
 
 router = APIRouter(
@@ -38,14 +41,29 @@ def get_card_by_id_endpoint(card_id: int, db: Session = Depends(get_db), current
 
 @router.get(
     "/list/{list_id}",
-    response_model=Sequence[CardRead])
-def get_cards_by_list_id_endpoint(list_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Sequence[CardRead]:
+    response_model=Sequence[CardListItem])
+def get_cards_by_list_id_endpoint(list_id: int, include_archived: bool = False, fields: list[str] | None = Depends(sparse_fields(CardRead)), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Response:
     db_list = get_list_by_id(db, list_id)
     if not db_list:
         raise HTTPException(status_code=404, detail="List not found")
     check_list_ownership(db_list, current_user)
-    cards = get_cards_by_list_id(db, list_id)
-    return [CardRead.model_validate(card) for card in cards]
+    cards = get_cards_by_list_id(db, list_id, fields, include_archived=include_archived)
+    return rows_response(cards)
+
+
+@router.post(
+    "/list/{list_id}/archive",
+    response_model=ArchiveResult)
+def archive_cards_in_list_endpoint(list_id: int, older_than: datetime, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> ArchiveResult:
+    db_list = get_list_by_id(db, list_id)
+    if not db_list:
+        raise HTTPException(status_code=404, detail="List not found")
+    check_list_ownership(db_list, current_user)
+    board_id = db_list.board_id
+    archived = archive_cards_in_list(db, list_id, older_than)
+    if archived:
+        activity_log.record(board_id, current_user.id, "archived_cards", "list", list_id)
+    return ArchiveResult(archived=archived)
 
 
 @router.post(
@@ -57,9 +75,10 @@ def create_card_endpoint(card: CardCreate, db: Session = Depends(get_db), curren
         raise HTTPException(status_code=404, detail="List not found")
     check_list_ownership(db_list, current_user)
     try:
-        db_card = create_card(db, card.title, card.description, card.list_id)
+        db_card = create_card(db, card.title, card.description, card.list_id, card.position, card.due_date)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    activity_log.record(db_list.board_id, current_user.id, "created", "card", db_card.id)
     return CardRead.model_validate(db_card)
 
 
@@ -67,12 +86,11 @@ def create_card_endpoint(card: CardCreate, db: Session = Depends(get_db), curren
     "/{card_id}",
     response_model=CardRead)
 def update_card_endpoint(card_id: int, card: CardUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> CardRead:
-    db_card = get_card_by_id(db, card_id)
-    check_card_ownership(db_card, current_user)
     try:
-        db_card = update_card(db, card_id, card.title, card.description)
+        db_card = update_card(db, card_id, current_user.id, card.title, card.description)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(db_card.board_id, current_user.id, "updated", "card", card_id)
     return CardRead.model_validate(db_card)
 
 
@@ -81,10 +99,33 @@ def update_card_endpoint(card_id: int, card: CardUpdate, db: Session = Depends(g
     status_code=status.HTTP_204_NO_CONTENT,
     response_model=None)
 def delete_card_endpoint(card_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Response:
-    db_card = get_card_by_id(db, card_id)
-    check_card_ownership(db_card, current_user)    
     try:
-        delete_card(db, card_id)
+        db_card = delete_card(db, card_id, current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+    activity_log.record(db_card.board_id, current_user.id, "deleted", "card", card_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/{card_id}/archive",
+    response_model=CardRead)
+def archive_card_endpoint(card_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> CardRead:
+    try:
+        db_card = archive_card(db, card_id, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(db_card.board_id, current_user.id, "archived", "card", card_id)
+    return CardRead.model_validate(db_card)
+
+
+@router.post(
+    "/{card_id}/restore",
+    response_model=CardRead)
+def restore_card_endpoint(card_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> CardRead:
+    try:
+        db_card = restore_card(db, card_id, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(db_card.board_id, current_user.id, "restored", "card", card_id)
+    return CardRead.model_validate(db_card)
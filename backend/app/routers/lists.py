@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from app.crud import get_list_by_id, get_lists_by_board_id, create_list, update_list, delete_list, get_board_by_id
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, sparse_fields
+from app.activity import activity_log
+from app.serialization import rows_response
 from sqlalchemy.orm import Session
 from collections.abc import Sequence
-from app.schemas import ListCreate, ListRead, ListUpdate
+from app.schemas import ListCreate, ListRead, ListItem, ListUpdate
 from app.models import User, List, Board
 
 
@@ -39,12 +41,12 @@ def get_list_by_id_endpoint(list_id: int, db: Session = Depends(get_db), current
 
 @router.get(
     "/board/{board_id}",
-    response_model=Sequence[ListRead])
-def get_lists_by_board_id_endpoint(board_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Sequence[ListRead]:
+    response_model=Sequence[ListItem])
+def get_lists_by_board_id_endpoint(board_id: int, fields: list[str] | None = Depends(sparse_fields(ListRead)), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Response:
     board = get_board_by_id(db, board_id)
     check_board_ownership(board, current_user)
-    lists = get_lists_by_board_id(db, board_id)
-    return [ListRead.model_validate(lst) for lst in lists]
+    lists = get_lists_by_board_id(db, board_id, fields)
+    return rows_response(lists)
 
 
 @router.post(
@@ -57,6 +59,7 @@ def create_list_endpoint(lst: ListCreate, db: Session = Depends(get_db), current
         db_list = create_list(db, lst.title, lst.board_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    activity_log.record(lst.board_id, current_user.id, "created", "list", db_list.id)
     return ListRead.model_validate(db_list)
 
 
@@ -64,12 +67,11 @@ def create_list_endpoint(lst: ListCreate, db: Session = Depends(get_db), current
     "/{list_id}",
     response_model=ListRead)
 def update_list_endpoint(list_id: int, lst: ListUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> ListRead:
-    check_lst = get_list_by_id(db, list_id)
-    check_list_ownership(check_lst, current_user)
     try:
-        db_list = update_list(db, list_id, lst.title)
+        db_list = update_list(db, list_id, current_user.id, lst.title)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(db_list.board_id, current_user.id, "updated", "list", list_id)
     return ListRead.model_validate(db_list)
 
 
@@ -78,11 +80,10 @@ def update_list_endpoint(list_id: int, lst: ListUpdate, db: Session = Depends(ge
     status_code=status.HTTP_204_NO_CONTENT,
     response_model=None)
 def delete_list_endpoint(list_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> Response:
-    lst = get_list_by_id(db, list_id)
-    check_list_ownership(lst, current_user)
     try:
-        delete_list(db, list_id)
+        db_list = delete_list(db, list_id, current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    activity_log.record(db_list.board_id, current_user.id, "deleted", "list", list_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
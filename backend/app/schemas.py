@@ -47,10 +47,27 @@ class BoardRead(BoardBase):
         "from_attributes": True
     }
 
+class BoardItem(BaseModel):
+    # Collection item: every field but id may be left out by ?fields=
+    id: int
+    title: str | None = None
+    description: str | None = None
+    owner_id: int | None = None
+
+class BoardSummary(BoardRead):
+    list_count: int = 0
+    card_count: int = 0
+    overdue_count: int = 0
+
 class ListBase(BaseModel):
     title: str
     board_id: int
 
+class ListItem(BaseModel):
+    id: int
+    title: str | None = None
+    board_id: int | None = None
+
 class ListCreate(ListBase):
     pass
 
@@ -71,6 +88,17 @@ class CardBase(BaseModel):
     position: int
     due_date: datetime | None = None
 
+class CardItem(BaseModel):
+    id: int
+    title: str | None = None
+    description: str | None = None
+    list_id: int | None = None
+    position: int | None = None
+    due_date: datetime | None = None
+
+class CardListItem(CardItem):
+    archived: bool = False
+
 class CardCreate(CardBase):
     pass
 
@@ -85,4 +113,24 @@ class CardRead(CardBase):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class ArchiveResult(BaseModel):
+    archived: int
+
+class ActivityRead(BaseModel):
+    id: int
+    board_id: int
+    user_id: int
+    action: str
+    entity_type: str
+    entity_id: int
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
+
+class ActivityPage(BaseModel):
+    items: list[ActivityRead]
+    next_before_id: int | None = None
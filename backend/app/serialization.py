@@ -0,0 +1,17 @@
+# backend/app/serialization.py
+from collections.abc import Sequence
+from typing import Any
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+
+_rows_adapter = TypeAdapter(list[dict[str, Any]])
+
+
+def rows_response(rows: Sequence[Row]) -> Response:
+    """Serialize Core result rows to a JSON response in one pass.
+
+    Skips building an ORM instance and a Pydantic model per row; the columns
+    were already chosen to match the endpoint's response schema.
+    """
+    return Response(content=_rows_adapter.dump_json([row._asdict() for row in rows]), media_type="application/json")
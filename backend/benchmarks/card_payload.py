@@ -0,0 +1,65 @@
+# backend/benchmarks/card_payload.py
+# Bytes on the wire and serialization time for a 5k-card list, full vs sparse.
+# Run with: python -m benchmarks.card_payload
+import gzip
+import time
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from app.crud import get_cards_by_list_id
+from app.models import Base, User, Board, List, Card
+from app.serialization import rows_response
+
+CARD_COUNT = 5000
+DESCRIPTION = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+SPARSE_FIELDS = ["id", "title", "position"]
+
+
+def seed(db):
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    board = Board(name="bench", owner_id=user.id)
+    db.add(board)
+    db.flush()
+    lst = List(name="bench", board_id=board.id)
+    db.add(lst)
+    db.flush()
+    db.execute(insert(Card), [
+        {"title": f"Card {i}", "description": DESCRIPTION, "list_id": lst.id, "position": i}
+        for i in range(CARD_COUNT)
+    ])
+    db.commit()
+    return lst.id
+
+
+def full_payload(db, list_id):
+    return rows_response(get_cards_by_list_id(db, list_id)).body
+
+
+def sparse_payload(db, list_id):
+    return rows_response(get_cards_by_list_id(db, list_id, SPARSE_FIELDS)).body
+
+
+def measure(name, build, db, list_id, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        db.expunge_all()
+        start = time.perf_counter()
+        body = build(db, list_id)
+        best = min(best, time.perf_counter() - start)
+    compressed = gzip.compress(body, compresslevel=6)
+    print(f"{name:<8} {len(body):>10,} B raw {len(compressed):>9,} B gzip {best * 1000:>8.1f} ms")
+
+
+def main():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    list_id = seed(db)
+    print(f"{CARD_COUNT} cards, best of 5")
+    measure("full", full_payload, db, list_id)
+    measure("sparse", sparse_payload, db, list_id)
+
+
+if __name__ == "__main__":
+    main()
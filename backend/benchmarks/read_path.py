@@ -0,0 +1,74 @@
+# backend/benchmarks/read_path.py
+# Peak memory and time per row for a 5k-card list read: ORM + Pydantic vs Core rows.
+# Run with: python -m benchmarks.read_path
+import json
+import time
+import tracemalloc
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.crud import get_cards_by_list_id, get_lists_by_board_id, get_boards_by_owner_id
+from app.models import Base, Board, List, Card
+from app.schemas import BoardRead, ListRead, CardRead
+from app.serialization import rows_response
+from benchmarks.card_payload import CARD_COUNT, seed
+
+_cards_adapter = TypeAdapter(list[CardRead])
+
+
+def orm_read(db, list_id):
+    # The previous read path: ORM instances copied into Pydantic models.
+    cards = db.query(Card).filter(Card.list_id == list_id).all()
+    return _cards_adapter.dump_json([CardRead.model_validate(card) for card in cards])
+
+
+def row_read(db, list_id):
+    return rows_response(get_cards_by_list_id(db, list_id)).body
+
+
+def measure(name, read, db, list_id, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        db.expunge_all()
+        start = time.perf_counter()
+        read(db, list_id)
+        best = min(best, time.perf_counter() - start)
+
+    db.expunge_all()
+    tracemalloc.start()
+    read(db, list_id)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<6} peak {peak / 1024:>9,.0f} KiB  {peak / CARD_COUNT:>7,.0f} B/row  "
+          f"{best * 1e6 / CARD_COUNT:>6.2f} us/row")
+
+
+def check_collection_reads(db, list_id):
+    # Board and list rows are mapped onto their schemas (name -> title), so
+    # make sure every collection read still serializes to a valid payload.
+    lst = db.get(List, list_id)
+    board = db.get(Board, lst.board_id)
+    reads = [
+        ("boards", BoardRead, lambda: get_boards_by_owner_id(db, board.owner_id)),
+        ("lists", ListRead, lambda: get_lists_by_board_id(db, board.id)),
+        ("cards", CardRead, lambda: get_cards_by_list_id(db, list_id)),
+    ]
+    for name, schema, read in reads:
+        payload = json.loads(rows_response(read()).body)
+        TypeAdapter(list[schema]).validate_python(payload)
+        print(f"{name:<6} {len(payload)} rows match {schema.__name__}")
+
+
+def main():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    list_id = seed(db)
+    check_collection_reads(db, list_id)
+    print(f"{CARD_COUNT} cards, time is best of 5")
+    measure("orm", orm_read, db, list_id)
+    measure("rows", row_read, db, list_id)
+
+
+if __name__ == "__main__":
+    main()
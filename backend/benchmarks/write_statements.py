@@ -0,0 +1,87 @@
+# backend/benchmarks/write_statements.py
+# Counts the SQL statements each crud mutator issues and fails if it regresses.
+# Run with: python -m benchmarks.write_statements
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from app.crud import update_card, delete_card, update_list, delete_list, update_board, delete_board
+from app.models import Base, User, Board, List, Card
+
+# (statements, commits) per call
+EXPECTED = {
+    "update_card": (1, 1),
+    "delete_card": (3, 1),  # DELETE ... RETURNING + list and board counters
+    "update_list": (1, 1),
+    "update_board": (1, 1),
+    "delete_list": (4, 1),  # DELETE ... RETURNING + its (archived) cards + board counters
+    "delete_board": (4, 1),  # DELETE ... RETURNING + its (archived) cards + its lists
+}
+
+
+@contextmanager
+def count_statements(engine):
+    counts = {"statements": 0, "commits": 0}
+
+    def on_execute(*args):
+        counts["statements"] += 1
+
+    def on_commit(conn):
+        counts["commits"] += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    try:
+        yield counts
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(engine, "commit", on_commit)
+
+
+def seed(db):
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    board = Board(name="bench", owner_id=user.id)
+    db.add(board)
+    db.flush()
+    lists = [List(name=f"list {i}", board_id=board.id) for i in range(2)]
+    db.add_all(lists)
+    db.flush()
+    db.execute(insert(Card), [
+        {"title": f"Card {i}", "description": "", "list_id": lists[i % 2].id, "position": i}
+        for i in range(4)
+    ])
+    db.commit()
+    return user.id, board.id, [lst.id for lst in lists]
+
+
+def main():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    owner_id, board_id, list_ids = seed(db)
+    db.close()
+
+    calls = [
+        ("update_card", lambda db: update_card(db, 1, owner_id, description="moved")),
+        ("delete_card", lambda db: delete_card(db, 2, owner_id)),
+        ("update_list", lambda db: update_list(db, list_ids[0], owner_id, title="renamed")),
+        ("update_board", lambda db: update_board(db, board_id, owner_id, title="renamed")),
+        ("delete_list", lambda db: delete_list(db, list_ids[1], owner_id)),
+        ("delete_board", lambda db: delete_board(db, board_id, owner_id)),
+    ]
+    failed = False
+    for name, call in calls:
+        db = sessionmaker(bind=engine)()
+        with count_statements(engine) as counts:
+            call(db)
+        db.close()
+        actual = (counts["statements"], counts["commits"])
+        status = "ok" if actual == EXPECTED[name] else f"expected {EXPECTED[name]}"
+        failed |= actual != EXPECTED[name]
+        print(f"{name:<14} {actual[0]} statements, {actual[1]} commit  {status}")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()